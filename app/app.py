@@ -1,18 +1,158 @@
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 import os
+import functools
+import hashlib
+import heapq
 import logging
+import threading
+import time
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 
+
+class OrjsonProvider(JSONProvider):
+    """Serve jsonify() and request.get_json() through orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), mimetype="application/json"
+        )
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Redis when REDIS_URL is configured, otherwise a per-process in-memory cache.
+# Payloads can hold thousands of articles, so keep as few as the fetch cache does.
+SEARCH_CACHE_MAX_ENTRIES = 32
+cache = Cache(app, config={
+    "CACHE_TYPE": "RedisCache" if os.environ.get("REDIS_URL") else "SimpleCache",
+    "CACHE_REDIS_URL": os.environ.get("REDIS_URL"),
+    "CACHE_THRESHOLD": SEARCH_CACHE_MAX_ENTRIES,
+})
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 NEWSAPI_ENDPOINT = "https://newsapi.org/v2/everything"
 NEWSAPI_KEY = os.environ.get("NEWSAPI_KEY")
+# Naive UTC reference for the per-article "ts" seconds value
+EPOCH = datetime(1970, 1, 1)
+
+# Parsed NewsAPI results keyed by request parameters: key -> (fetched_ts, articles)
+FETCH_CACHE_TTL = 900
+FETCH_CACHE_MAX_ENTRIES = 32
+_FETCH_CACHE: Dict[Tuple[Any, ...], Tuple[float, Tuple[Mapping[str, Any], ...]]] = {}
+_FETCH_CACHE_LOCK = threading.Lock()
+# Fetches currently running, so concurrent identical requests wait instead of refetching
+_INFLIGHT: Dict[Tuple[Any, ...], Future] = {}
+
+# /search response TTLs (seconds): shorter ranges go stale sooner
+SEARCH_CACHE_TTL = {
+    "past_24_hours": 900, "last_1_day": 900,
+    "past_week": 3600, "last_7_days": 3600,
+    "past_month": 21600, "last_30_days": 21600,
+    "past_year": 21600, "last_365_days": 21600,
+}
+CUSTOM_RANGE_CACHE_TTL = 21600
+
+# Concurrent NewsAPI page fetches per search; each search gets its own pool
+# so one large search cannot queue ahead of everyone else's pages
+NEWSAPI_MAX_WORKERS = 8
+
+# Keep-alive connections to NewsAPI are reused across pages and requests
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=NEWSAPI_MAX_WORKERS,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504], raise_on_status=False),
+))
+
+
+def _fetch_newsapi_page(params: Dict[str, Any], api_key: str) -> Dict[str, Any]:
+    """Fetch a single page from NewsAPI and return its payload, or an error dict."""
+    try:
+        resp = _SESSION.get(NEWSAPI_ENDPOINT, params=params, headers={"X-Api-Key": api_key}, timeout=10)
+    except requests.RequestException as e:
+        logger.error(f"NewsAPI request failed: {e}")
+        return {"error": "Failed to reach NewsAPI"}
+
+    if resp.status_code != 200:
+        try:
+            payload = resp.json()
+            msg = payload.get("message")
+        except Exception:
+            msg = None
+        logger.error(f"NewsAPI error {resp.status_code}: {msg}")
+        return {"error": msg or f"NewsAPI error {resp.status_code}"}
+
+    payload = resp.json()
+    if payload.get("status") != "ok":
+        return {"error": payload.get("message") or "NewsAPI returned an error"}
+    return payload
+
+
+def _parse_newsapi_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert raw NewsAPI articles into the internal article format."""
+    parsed: List[Dict[str, Any]] = []
+    append = parsed.append
+    for art in articles:
+        get = art.get
+        published_raw = get("publishedAt")
+        if not published_raw:
+            continue
+        try:
+            if (
+                len(published_raw) == 20
+                and published_raw[4] == published_raw[7] == "-"
+                and published_raw[10] == "T"
+                and published_raw[13] == published_raw[16] == ":"
+                and published_raw[19] == "Z"
+            ):
+                # Fast path for NewsAPI's usual "YYYY-MM-DDTHH:MM:SSZ"
+                dt = datetime(
+                    int(published_raw[0:4]), int(published_raw[5:7]), int(published_raw[8:10]),
+                    int(published_raw[11:13]), int(published_raw[14:16]), int(published_raw[17:19]),
+                )
+            else:
+                dt = datetime.fromisoformat(published_raw.replace("Z", "+00:00")).replace(tzinfo=None)
+        except ValueError:
+            continue
+        source = (get("source") or {}).get("name")
+        # Preformatted once here instead of strftime per use downstream
+        day_key = f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        append({
+            "title": get("title"),
+            "link": get("url"),
+            "published": dt,
+            "ts": (dt - EPOCH).total_seconds(),
+            "day_key": day_key,
+            # ISO week starts on Monday
+            "week_key": date.fromordinal(dt.toordinal() - dt.weekday()).isoformat(),
+            "month_key": f"{dt.year:04d}-{dt.month:02d}-01",
+            "pub_str": f"{day_key} {dt.hour:02d}:{dt.minute:02d}",
+            "source": source,
+            "source_lower": (source or "").lower(),
+            "authority": get_source_authority_weight(source),
+            "description": get("description") or "",
+        })
+    return parsed
 
 
 def fetch_newsapi_articles(
@@ -37,10 +177,73 @@ def fetch_newsapi_articles_with_key(
     sort_by: str = "popularity",
     language: str = "en",
 ) -> Dict[str, Any]:
-    """Fetch articles from NewsAPI with a provided API key."""
+    """Fetch articles from NewsAPI with a provided API key.
+
+    Returns {"articles": [...]} whose articles are read-only mappings shared
+    with the fetch cache, or {"error": "..."}.
+    """
     if not api_key:
         return {"error": "NEWSAPI_KEY is missing"}
 
+    # Relative ranges end at "now", so key on TTL-sized time slots to let repeat queries share an entry
+    cache_key = (query, _ttl_slot(start), _ttl_slot(end), amount, api_key, sort_by, language)
+    with _FETCH_CACHE_LOCK:
+        cached = _FETCH_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < FETCH_CACHE_TTL:
+            return {"articles": list(cached[1])}
+        # Identical fetches already in flight share the leader's result
+        future = _INFLIGHT.get(cache_key)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[cache_key] = Future()
+    if not leader:
+        shared = future.result()
+        return {"articles": list(shared["articles"])} if "articles" in shared else shared
+
+    try:
+        result = _download_newsapi_articles(query, start, end, amount, api_key, sort_by, language)
+    except BaseException as e:
+        with _FETCH_CACHE_LOCK:
+            del _INFLIGHT[cache_key]
+        future.set_exception(e)
+        raise
+
+    # Cached and shared results are frozen: read-only articles in a tuple, and
+    # every caller (this one included) gets its own list of them
+    if "articles" in result:
+        shared = {"articles": tuple(MappingProxyType(art) for art in result["articles"])}
+        result = {"articles": list(shared["articles"])}
+    else:
+        shared = result
+    now = time.monotonic()
+    with _FETCH_CACHE_LOCK:
+        if "articles" in shared:
+            for key in [k for k, (ts, _) in _FETCH_CACHE.items() if now - ts >= FETCH_CACHE_TTL]:
+                del _FETCH_CACHE[key]
+            # Entries are inserted in fetch order, so the first ones are the oldest
+            while len(_FETCH_CACHE) >= FETCH_CACHE_MAX_ENTRIES:
+                del _FETCH_CACHE[next(iter(_FETCH_CACHE))]
+            _FETCH_CACHE[cache_key] = (now, shared["articles"])
+        del _INFLIGHT[cache_key]
+    future.set_result(shared)
+    return result
+
+
+def _ttl_slot(dt: datetime) -> int:
+    """Return the index of the FETCH_CACHE_TTL-sized time slot containing `dt`."""
+    return int((dt - EPOCH).total_seconds() // FETCH_CACHE_TTL)
+
+
+def _download_newsapi_articles(
+    query: str,
+    start: datetime,
+    end: datetime,
+    amount: int,
+    api_key: str,
+    sort_by: str,
+    language: str,
+) -> Dict[str, Any]:
+    """Download and parse up to `amount` articles from NewsAPI, bypassing the caches."""
     page_size = min(100, amount)
     max_pages = (amount + page_size - 1) // page_size
     params_base = {
@@ -52,87 +255,58 @@ def fetch_newsapi_articles_with_key(
         "pageSize": page_size,
     }
 
-    collected: List[Dict[str, Any]] = []
-    for page in range(1, max_pages + 1):
-        params = {**params_base, "page": page}
-        try:
-            resp = requests.get(NEWSAPI_ENDPOINT, params=params, headers={"X-Api-Key": api_key}, timeout=10)
-        except requests.RequestException as e:
-            logger.error(f"NewsAPI request failed: {e}")
-            return {"error": "Failed to reach NewsAPI"}
-
-        if resp.status_code != 200:
-            try:
-                payload = resp.json()
-                msg = payload.get("message")
-            except Exception:
-                msg = None
-            logger.error(f"NewsAPI error {resp.status_code}: {msg}")
-            return {"error": msg or f"NewsAPI error {resp.status_code}"}
-
-        payload = resp.json()
-        if payload.get("status") != "ok":
-            return {"error": payload.get("message") or "NewsAPI returned an error"}
-
-        articles = payload.get("articles", [])
-        for art in articles:
-            published_raw = art.get("publishedAt")
-            if not published_raw:
-                continue
-            try:
-                dt = datetime.fromisoformat(published_raw.replace("Z", "+00:00")).replace(tzinfo=None)
-            except ValueError:
-                continue
-            collected.append({
-                "title": art.get("title"),
-                "link": art.get("url"),
-                "published": dt,
-                "source": (art.get("source") or {}).get("name"),
-                "description": art.get("description") or "",
-            })
-
-        total_results = payload.get("totalResults") or 0
-        if len(collected) >= amount:
-            break
-        if page * page_size >= total_results:
-            break
+    # The first page tells us totalResults; the remaining pages are fetched concurrently
+    first = _fetch_newsapi_page({**params_base, "page": 1}, api_key)
+    if first.get("error"):
+        return first
 
-    # Sort newest first
-    collected.sort(key=lambda x: x["published"], reverse=True)
-    return {"articles": collected[:amount]}
+    total_results = first.get("totalResults") or 0
+    last_page = min(max_pages, (total_results + page_size - 1) // page_size)
+    payloads = [first]
+    if last_page > 1:
+        pool = ThreadPoolExecutor(max_workers=min(NEWSAPI_MAX_WORKERS, last_page - 1))
+        try:
+            pages = pool.map(
+                lambda page: _fetch_newsapi_page({**params_base, "page": page}, api_key),
+                range(2, last_page + 1),
+            )
+            for payload in pages:
+                if payload.get("error"):
+                    return payload
+                payloads.append(payload)
+        finally:
+            # On an error, drop the pages not yet started instead of waiting for them
+            pool.shutdown(wait=False, cancel_futures=True)
 
+    collected: List[Dict[str, Any]] = []
+    for payload in payloads:
+        collected.extend(_parse_newsapi_articles(payload.get("articles", [])))
 
-def filter_by_range(items: List[Dict[str, Any]], start: datetime, end: datetime) -> List[Dict[str, Any]]:
-    return [i for i in items if start <= i["published"] <= end]
+    # Keep the newest `amount` articles, newest first
+    collected = heapq.nlargest(amount, collected, key=lambda x: x["published"])
+    return {"articles": collected}
 
 
-def filter_by_sources(items: List[Dict[str, Any]], sources: List[str]) -> List[Dict[str, Any]]:
+def filter_by_sources(items: List[Mapping[str, Any]], sources: List[str]) -> List[Mapping[str, Any]]:
     if not sources:
         return items
-    # Case-insensitive partial matching
-    sources_lower = [s.lower() for s in sources]
-    filtered = []
-    for item in items:
-        source = (item.get("source") or "").lower()
-        if any(s in source for s in sources_lower):
-            filtered.append(item)
-    return filtered
-
-
-def bucket_by_day(items: List[Dict[str, Any]]) -> Dict[str, int]:
-    buckets: Dict[str, int] = {}
-    for i in items:
-        key = i["published"].strftime("%Y-%m-%d")
-        buckets[key] = buckets.get(key, 0) + 1
-    return dict(sorted(buckets.items(), key=lambda kv: kv[0]))
+    # Case-insensitive partial matching: one alternation scan per article
+    pattern = re.compile("|".join(re.escape(s.lower()) for s in sources))
+    return [item for item in items if pattern.search(item["source_lower"])]
+
+
+def bucket_by_day(items: List[Mapping[str, Any]]) -> Dict[str, int]:
+    return dict(sorted(Counter(i["day_key"] for i in items).items()))
 
 
-STOPWORDS = set([
+STOPWORDS = frozenset([
     "the","a","an","and","or","but","if","then","else","for","on","in","at","to","of","by","with","from","as",
     "is","are","was","were","be","been","being","this","that","these","those","about","over","under","after","before",
     "into","out","up","down","off","not","no","so","it","its","it's","their","his","her","him","she","he","they","them",
     "you","your","i","we","our","us"
 ])
+_NON_ALNUM = re.compile(r"[^a-z0-9\s]")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
 
 # Source authority weights for importance scoring
 SOURCE_AUTHORITY = {
@@ -161,8 +335,9 @@ SOURCE_AUTHORITY = {
 }
 
 
+@functools.lru_cache(maxsize=4096)
 def get_source_authority_weight(source: str) -> float:
-    """Return authority weight for a news source."""
+    """Return authority weight for a news source (memoized per source name)."""
     if not source:
         return 1.0
     source_lower = source.lower()
@@ -172,154 +347,139 @@ def get_source_authority_weight(source: str) -> float:
     return 1.0
 
 
-def calculate_importance_score(cluster: List[Dict[str, Any]], period_start: datetime, period_end: datetime) -> float:
+def combine_importance(article_count: int, unique_sources: int, authority_score: float, avg_freshness: float) -> float:
     """
-    Calculate importance score for an article cluster using:
+    Calculate importance score for an article cluster from its aggregates:
     - Coverage volume (40%)
     - Source diversity (25%)
     - Source authority (20%)
     - Temporal freshness (15%)
     """
-    article_count = len(cluster)
-    
-    # Source diversity: count unique sources
-    unique_sources = len(set(
-        (art.get("source") or "unknown").lower() 
-        for art in cluster
-    ))
-    
-    # Authority-weighted count
-    authority_score = sum(
-        get_source_authority_weight(art.get("source"))
-        for art in cluster
-    )
-    
-    # Temporal freshness: articles closer to period end are "fresher"
-    period_duration = (period_end - period_start).total_seconds()
-    if period_duration > 0:
-        freshness_scores = []
-        for art in cluster:
-            time_diff = (art["published"] - period_start).total_seconds()
-            # Normalize to 0-1 (later in period = higher freshness)
-            freshness = time_diff / period_duration
-            freshness_scores.append(freshness)
-        avg_freshness = sum(freshness_scores) / len(freshness_scores) if freshness_scores else 0.5
-    else:
-        avg_freshness = 0.5
-    
-    # Combined importance score
-    importance = (
+    return (
         article_count * 0.4 +
         unique_sources * 0.25 +
         authority_score * 0.2 +
         avg_freshness * 15 * 0.15  # Scale freshness to comparable range
     )
-    
-    return importance
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_title(title: str) -> str:
     if not title:
         return ""
-    t = title.lower()
-    t = re.sub(r"[^a-z0-9\s]", " ", t)
-    tokens = [w for w in t.split() if len(w) >= 3 and w not in STOPWORDS]
+    t = _NON_ALNUM.sub(" ", title.lower())
     # keep first few informative tokens to form a canonical key
-    return " ".join(tokens[:8])
-
+    tokens: List[str] = []
+    for w in t.split():
+        if len(w) >= 3 and w not in STOPWORDS:
+            tokens.append(w)
+            if len(tokens) == 8:
+                break
+    return " ".join(tokens)
 
-def day_start(d: datetime) -> datetime:
-    return datetime(d.year, d.month, d.day)
 
+# Precomputed article field holding the period start for each granularity
+PERIOD_KEYS = {"daily": "day_key", "weekly": "week_key", "monthly": "month_key"}
 
-def week_start(d: datetime) -> datetime:
-    # ISO week starts on Monday
-    base = d - timedelta(days=d.weekday())
-    return datetime(base.year, base.month, base.day)
 
-
-def month_start(d: datetime) -> datetime:
-    return datetime(d.year, d.month, 1)
-
-
-def key_events_by_period(items: List[Dict[str, Any]], granularity: str) -> List[Dict[str, Any]]:
-    buckets: Dict[str, List[Dict[str, Any]]] = {}
+def key_events_by_period(items: List[Mapping[str, Any]], granularity: str) -> List[Dict[str, Any]]:
+    period_key = PERIOD_KEYS.get(granularity, "week_key")  # weekly default
+    buckets: Dict[str, List[Mapping[str, Any]]] = defaultdict(list)
     for i in items:
-        if granularity == "daily":
-            ps = day_start(i["published"]).strftime("%Y-%m-%d")
-        elif granularity == "monthly":
-            ps = month_start(i["published"]).strftime("%Y-%m-%d")
-        else:  # weekly default
-            ps = week_start(i["published"]).strftime("%Y-%m-%d")
-        buckets.setdefault(ps, []).append(i)
+        buckets[i[period_key]].append(i)
 
     result: List[Dict[str, Any]] = []
     for ps, arr in buckets.items():
-        groups: Dict[str, List[Dict[str, Any]]] = {}
-        for art in arr:
-            key = normalize_title(art.get("title") or "")
-            if not key:
-                key = art.get("title") or art.get("link") or "unknown"
-            groups.setdefault(key, []).append(art)
-
-        # Calculate period boundaries for freshness scoring
-        period_start_dt = datetime.strptime(ps, "%Y-%m-%d")
-        if granularity == "daily":
-            period_end_dt = period_start_dt + timedelta(days=1)
-        elif granularity == "monthly":
-            # Next month start
-            if period_start_dt.month == 12:
-                period_end_dt = datetime(period_start_dt.year + 1, 1, 1)
-            else:
-                period_end_dt = datetime(period_start_dt.year, period_start_dt.month + 1, 1)
-        else:  # weekly
-            period_end_dt = period_start_dt + timedelta(days=7)
-
-        # Score each cluster and pick the most important
-        best_cluster: List[Dict[str, Any]] = []
-        best_score = -1
-        for cluster in groups.values():
-            score = calculate_importance_score(cluster, period_start_dt, period_end_dt)
-            if score > best_score:
-                best_score = score
-                best_cluster = cluster
-
-        if not best_cluster:
-            continue
-        
-        # Pick earliest article as representative
-        rep = sorted(best_cluster, key=lambda x: x["published"])[0]
-
-        # Create a concise summary (1-2 sentences) from cluster descriptions/titles
-        summary = summarize_cluster(best_cluster, fallback_title=rep.get("title") or "")
-        
-        # Calculate source diversity and authority for display
-        unique_sources = len(set(
-            (art.get("source") or "unknown").lower() 
-            for art in best_cluster
-        ))
-        avg_authority = sum(
-            get_source_authority_weight(art.get("source"))
-            for art in best_cluster
-        ) / len(best_cluster)
-        
-        result.append({
-            "periodStart": ps,
-            "title": rep.get("title"),
-            "link": rep.get("link"),
-            "published": rep["published"].strftime("%Y-%m-%d %H:%M"),
-            "clusterSize": len(best_cluster),
-            "importanceScore": round(best_score, 2),
-            "uniqueSources": unique_sources,
-            "avgAuthority": round(avg_authority, 2),
-            "summary": summary,
-        })
-
+        event = _build_event(ps, arr, granularity)
+        if event:
+            result.append(event)
     result.sort(key=lambda x: x["periodStart"])  # chronological
     return result
 
 
-def summarize_cluster(cluster: List[Dict[str, Any]], fallback_title: str) -> str:
+def _build_event(ps: str, arr: List[Mapping[str, Any]], granularity: str) -> Optional[Dict[str, Any]]:
+    """Pick and describe the key event among the articles of one period."""
+    # Calculate period boundaries for freshness scoring
+    period_start_dt = datetime.strptime(ps, "%Y-%m-%d")
+    if granularity == "daily":
+        period_end_dt = period_start_dt + timedelta(days=1)
+    elif granularity == "monthly":
+        # Next month start
+        if period_start_dt.month == 12:
+            period_end_dt = datetime(period_start_dt.year + 1, 1, 1)
+        else:
+            period_end_dt = datetime(period_start_dt.year, period_start_dt.month + 1, 1)
+    else:  # weekly
+        period_end_dt = period_start_dt + timedelta(days=7)
+    period_duration = (period_end_dt - period_start_dt).total_seconds()
+    period_start_ts = (period_start_dt - EPOCH).total_seconds()
+
+    if len(arr) == 1:
+        # A lone article is its own key event: skip title grouping and cluster scoring
+        art = arr[0]
+        freshness = (art["ts"] - period_start_ts) / period_duration
+        return {
+            "periodStart": ps,
+            "title": art.get("title"),
+            "link": art.get("link"),
+            "published": art["pub_str"],
+            "clusterSize": 1,
+            "importanceScore": round(combine_importance(1, 1, art["authority"], freshness), 2),
+            "uniqueSources": 1,
+            "avgAuthority": round(art["authority"], 2),
+            "summary": summarize_cluster(arr, fallback_title=art.get("title") or ""),
+        }
+
+    # Group by title and accumulate the scoring aggregates in the same pass
+    groups: Dict[str, Dict[str, Any]] = defaultdict(
+        lambda: {"articles": [], "sources": set(), "authority": 0.0, "ts_total": 0.0}
+    )
+    for art in arr:
+        key = normalize_title(art.get("title") or "")
+        if not key:
+            key = art.get("title") or art.get("link") or "unknown"
+        group = groups[key]
+        group["articles"].append(art)
+        group["sources"].add(art["source_lower"] or "unknown")
+        group["authority"] += art["authority"]
+        group["ts_total"] += art["ts"]
+
+    if not groups:
+        return None
+
+    # Score each cluster from its aggregates and pick the most important
+    for g in groups.values():
+        count = len(g["articles"])
+        avg_freshness = (g["ts_total"] / count - period_start_ts) / period_duration
+        g["score"] = combine_importance(count, len(g["sources"]), g["authority"], avg_freshness)
+    best = max(groups.values(), key=lambda g: g["score"])
+    best_score = best["score"]
+    best_cluster = best["articles"]
+
+    # Pick earliest article as representative
+    rep = min(best_cluster, key=lambda x: x["published"])
+
+    # Create a concise summary (1-2 sentences) from cluster descriptions/titles
+    summary = summarize_cluster(best_cluster, fallback_title=rep.get("title") or "")
+    
+    # Source diversity and authority for display
+    unique_sources = len(best["sources"])
+    avg_authority = best["authority"] / len(best_cluster)
+
+    return {
+        "periodStart": ps,
+        "title": rep.get("title"),
+        "link": rep.get("link"),
+        "published": rep["pub_str"],
+        "clusterSize": len(best_cluster),
+        "importanceScore": round(best_score, 2),
+        "uniqueSources": unique_sources,
+        "avgAuthority": round(avg_authority, 2),
+        "summary": summary,
+    }
+
+
+def summarize_cluster(cluster: List[Mapping[str, Any]], fallback_title: str) -> str:
     """Return a 1-2 sentence summary from available descriptions.
     Strategy:
     - Prefer non-empty descriptions; pick the most informative (longest within limit)
@@ -328,7 +488,7 @@ def summarize_cluster(cluster: List[Dict[str, Any]], fallback_title: str) -> str
     """
     descs = [c.get("description", "").strip() for c in cluster if c.get("description")]
     # Normalize whitespace
-    descs = [re.sub(r"\s+", " ", d) for d in descs]
+    descs = [" ".join(d.split()) for d in descs]
     if not descs:
         return fallback_title
 
@@ -336,8 +496,7 @@ def summarize_cluster(cluster: List[Dict[str, Any]], fallback_title: str) -> str
     descs.sort(key=len, reverse=True)
 
     def first_sentence(text: str) -> str:
-        parts = re.split(r"(?<=[.!?])\s+", text)
-        return parts[0].strip() if parts else text.strip()
+        return _SENTENCE_END.split(text, maxsplit=1)[0].strip()
 
     s1 = first_sentence(descs[0])
     s2 = ""
@@ -408,17 +567,31 @@ def search():
         except ValueError:
             return jsonify({"error": "Invalid custom dates"}), 400
 
+    # Relative ranges are keyed by name so repeat queries hit within the TTL
+    cache_ttl = SEARCH_CACHE_TTL.get(time_range, CUSTOM_RANGE_CACHE_TTL)
+    range_key = time_range if time_range in SEARCH_CACHE_TTL else (start.isoformat(), end.isoformat())
+    cache_key = "search:" + hashlib.sha256(repr((
+        query, range_key, amount, granularity, sorted(sources),
+        hashlib.sha256(api_key.encode()).hexdigest(),
+    )).encode()).hexdigest()
+    # A cache backend outage (e.g. Redis down) only costs us the cache, never the response
+    try:
+        cached = cache.get(cache_key)
+    except Exception as e:
+        logger.warning(f"Search cache lookup failed: {e}")
+        cached = None
+    if cached is not None:
+        return jsonify(cached)
+
     # Fetch from NewsAPI
     fetch_result = fetch_newsapi_articles_with_key(query, start, end, amount, api_key)
     if fetch_result.get("error"):
         return jsonify({"error": fetch_result["error"]}), 500
 
     entries = fetch_result.get("articles", [])
-    
-    # Filter by range (NewsAPI should already respect this, but double-check)
-    filtered = filter_by_range(entries, start, end)
-    # Filter by sources if specified
-    filtered = filter_by_sources(filtered, sources)
+
+    # NewsAPI already restricts results to the from/to range; filter by sources if specified
+    filtered = filter_by_sources(entries, sources)
 
     # Bucket by day for counts (still returned if needed)
     buckets = bucket_by_day(filtered)
@@ -431,13 +604,13 @@ def search():
         {
             "title": e["title"],
             "link": e["link"],
-            "published": e["published"].strftime("%Y-%m-%d %H:%M"),
-            "source": e.get("source")
+            "published": e["pub_str"],
+            "source": e["source"],
         }
         for e in filtered
     ]
 
-    return jsonify({
+    result = {
         "timeline": buckets,
         "keyEvents": key_events,
         "granularity": granularity,
@@ -446,7 +619,12 @@ def search():
             "start": start.strftime("%Y-%m-%d"),
             "end": end.strftime("%Y-%m-%d")
         }
-    })
+    }
+    try:
+        cache.set(cache_key, result, timeout=cache_ttl)
+    except Exception as e:
+        logger.warning(f"Search cache store failed: {e}")
+    return jsonify(result)
 
 
 if __name__ == "__main__":